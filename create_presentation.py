@@ -3,362 +3,561 @@
 """
 Erstellt eine PowerPoint-Präsentation für die Data Mining Aufgabe zur Betrugserkennung
 Strukturiert nach CRISP-DM-Prozess
+
+Optional als C-Erweiterung kompilierbar (mypy installiert): mypyc create_presentation.py
 """
 
+import argparse
+import contextlib
+import copy
+import hashlib
+import os
+import re
+import types
+import weakref
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+from lxml import etree  # type: ignore[import-untyped]
 from pptx import Presentation
-from pptx.util import Inches, Pt
+from pptx.util import Emu, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
+from pptx.opc import serialized
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.slide import CT_Slide
+from pptx.parts.slide import SlideLayoutPart, SlidePart
+from pptx.presentation import Presentation as PresentationT
+from pptx.slide import Slide, SlideLayout
+
+# Folieninhalte: Aufzählungspunkte als (Ebene, Text), Tabellen als Zeilen von Zelltexten
+Bullets = Tuple[Tuple[int, str], ...]
+TableData = Tuple[Tuple[str, ...], ...]
+# Eintrag in ALL_SLIDE_DATA: (Art, Titel, Inhalt[, Spaltenbreiten])
+SlideSpec = Tuple[Any, ...]
+
+# Maße als EMU-Ganzzahlen (1 Zoll = 914400 EMU), python-pptx akzeptiert sie direkt
+_EMU = 914400
+_SLIDE_WIDTH = Emu(10 * _EMU)
+_SLIDE_HEIGHT = Emu(int(7.5 * _EMU))
+_LEFT = _EMU
+_TOP = 2 * _EMU
+_WIDTH = 8 * _EMU
+
+# Formatierung der Tabellen, einmalig auf Modulebene angelegt
+_HEADER_BG = RGBColor(0x44, 0x72, 0xC4)
+_HEADER_FG = RGBColor(0xFF, 0xFF, 0xFF)
+_HEADER_SIZE = Pt(12)
+_BODY_SIZE = Pt(11)
+
+# Tabellen-XML, einmal vorgefertigt statt pro Zelle über die python-pptx-API
+# (Aufbau entspricht dem, was slide.shapes.add_table() erzeugt)
+_TABLE_FRAME_TMPL = (
+    '<p:graphicFrame %s><p:nvGraphicFramePr><p:cNvPr id="{id}" name="{name}"/>'
+    '<p:cNvGraphicFramePr><a:graphicFrameLocks noGrp="1"/></p:cNvGraphicFramePr><p:nvPr/>'
+    '</p:nvGraphicFramePr><p:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></p:xfrm>'
+    '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/table">'
+    '<a:tbl><a:tblPr firstRow="1" bandRow="1"><a:tableStyleId>{style}</a:tableStyleId></a:tblPr>'
+    '<a:tblGrid>{grid}</a:tblGrid>{rows}</a:tbl></a:graphicData></a:graphic></p:graphicFrame>'
+    % nsdecls('a', 'p')
+)
+_TABLE_STYLE_ID = "{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}"
+_GRID_COL_TMPL = '<a:gridCol w="{w}"/>'
+_ROW_TMPL = '<a:tr h="{h}">{cells}</a:tr>'
+
+# Kopfzeile: blauer Hintergrund, weiße fette Schrift; übrige Zeilen: normale Schrift
+_HEADER_CELL_TMPL = (
+    '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>{paragraphs}</a:txBody>'
+    '<a:tcPr><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:tcPr></a:tc>' % (_HEADER_BG,)
+)
+_HEADER_RUN_TMPL = (
+    '<a:r><a:rPr b="1" sz="%d"><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:rPr>'
+    '<a:t>{text}</a:t></a:r>' % (_HEADER_SIZE.centipoints, _HEADER_FG)
+)
+_BODY_CELL_TMPL = '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>{paragraphs}</a:txBody><a:tcPr/></a:tc>'
+_BODY_RUN_TMPL = '<a:r><a:rPr sz="%d"/><a:t>{text}</a:t></a:r>' % _BODY_SIZE.centipoints
+
+# Steuerzeichen außer Tab und Zeilenvorschub sind in XML unzulässig, python-pptx schreibt sie als _xHHHH_
+_CTRL_CHARS = re.compile(r"[\x00-\x08\x0B-\x1F]")
+
+# Unberührte Folien-XML je Layout: die Platzhalter des Layouts werden nur für die erste Folie
+# von python-pptx geklont, jede weitere Folie desselben Layouts ist eine Kopie davon
+_SLIDE_TEMPLATES: "weakref.WeakKeyDictionary[SlideLayoutPart, CT_Slide]" = weakref.WeakKeyDictionary()
+
+def _add_slide(prs: PresentationT, layout: SlideLayout) -> Slide:
+    """Fügt eine leere Folie mit dem Layout hinzu, ab der zweiten als Kopie der ersten"""
+    layout_part = layout.part
+    template = _SLIDE_TEMPLATES.get(layout_part)
+    if template is None:
+        slide = prs.slides.add_slide(layout)
+        _SLIDE_TEMPLATES[layout_part] = copy.deepcopy(slide._element)
+        return slide
+    
+    prs_part = prs.part
+    slide_part = SlidePart(
+        prs_part._next_slide_partname, CT.PML_SLIDE, prs_part.package, copy.deepcopy(template)
+    )
+    slide_part.relate_to(layout_part, RT.SLIDE_LAYOUT)
+    prs.slides._sldIdLst.add_sldId(prs_part.relate_to(slide_part, RT.SLIDE))
+    return slide_part.slide
 
-def create_title_slide(prs, title, subtitle):
+def create_title_slide(prs: PresentationT, layout: SlideLayout, title: str, subtitle: str) -> Slide:
     """Erstellt eine Titelfolie"""
-    slide = prs.slides.add_slide(prs.slide_layouts[0])
-    slide.shapes.title.text = title
+    slide = _add_slide(prs, layout)
+    slide.placeholders[0].text = title
     slide.placeholders[1].text = subtitle
     return slide
 
-def create_content_slide(prs, title, bullet_points=None):
+def create_content_slide(
+    prs: PresentationT, layout: SlideLayout, title: str, bullet_points: Optional[Bullets] = None
+) -> Slide:
     """Erstellt eine Folie mit Aufzählungspunkten"""
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
-    slide.shapes.title.text = title
+    slide = _add_slide(prs, layout)
+    slide.placeholders[0].text = title
     
     if bullet_points:
         body_shape = slide.placeholders[1]
         tf = body_shape.text_frame
         tf.clear()
         
-        for i, (level, text) in enumerate(bullet_points):
-            if i == 0:
-                p = tf.paragraphs[0]
-            else:
-                p = tf.add_paragraph()
+        # Erster Punkt in den vorhandenen Absatz, alle weiteren anhängen
+        items = iter(bullet_points)
+        p = tf.paragraphs[0]
+        p.level, p.text = next(items)
+        add_paragraph = tf.add_paragraph
+        for level, text in items:
+            p = add_paragraph()
             p.text = text
             p.level = level
     
     return slide
 
-def create_table_slide(prs, title, data, col_widths=None):
+def _split_evenly(total: int, count: int) -> List[int]:
+    """Teilt eine Länge gleichmäßig auf, das letzte Stück nimmt den Rundungsrest auf"""
+    part = total // count
+    return [part] * (count - 1) + [total - (count - 1) * part]
+
+def _escape_ctrl_char(match: "re.Match[str]") -> str:
+    """Ersetzt ein Steuerzeichen durch die Schreibweise von python-pptx (z. B. "_x0007_")"""
+    return "_x%04X_" % ord(match.group())
+
+def _cell_paragraphs_xml(text: str, run_tmpl: str) -> str:
+    """Erzeugt die <a:p>-Elemente einer Zelle wie TextFrame.text: "\\n" trennt Absätze, "\\v" wird <a:br/>"""
+    paragraphs = []
+    for line in text.split("\n"):
+        runs = [
+            run_tmpl.format(text=escape(_CTRL_CHARS.sub(_escape_ctrl_char, part))) if part else ""
+            for part in line.split("\v")
+        ]
+        paragraphs.append("<a:p>%s</a:p>" % "<a:br/>".join(runs))
+    return "".join(paragraphs)
+
+def _build_table_xml(
+    shape_id: int,
+    rows_data: TableData,
+    col_widths_emu: Sequence[int],
+    row_heights_emu: Sequence[int],
+    left_emu: int,
+    top_emu: int,
+) -> str:
+    """Erzeugt das komplette <p:graphicFrame>-XML einer formatierten Tabelle"""
+    grid = "".join(_GRID_COL_TMPL.format(w=w) for w in col_widths_emu)
+    
+    rows = []
+    for i, (row, height) in enumerate(zip(rows_data, row_heights_emu)):
+        cell_tmpl, run_tmpl = (
+            (_HEADER_CELL_TMPL, _HEADER_RUN_TMPL) if i == 0 else (_BODY_CELL_TMPL, _BODY_RUN_TMPL)
+        )
+        cells = []
+        for text in row:
+            cells.append(cell_tmpl.format(paragraphs=_cell_paragraphs_xml(text, run_tmpl)))
+        rows.append(_ROW_TMPL.format(h=height, cells="".join(cells)))
+    
+    return _TABLE_FRAME_TMPL.format(
+        id=shape_id,
+        name="Table %d" % (shape_id - 1),
+        x=left_emu,
+        y=top_emu,
+        cx=sum(col_widths_emu),
+        cy=sum(row_heights_emu),
+        style=_TABLE_STYLE_ID,
+        grid=grid,
+        rows="".join(rows),
+    )
+
+def create_table_slide(
+    prs: PresentationT,
+    layout: SlideLayout,
+    title: str,
+    data: TableData,
+    col_widths: Optional[Tuple[float, ...]] = None,
+) -> Slide:
     """Erstellt eine Folie mit Tabelle"""
-    slide = prs.slides.add_slide(prs.slide_layouts[5])
-    slide.shapes.title.text = title
+    slide = _add_slide(prs, layout)
+    slide.placeholders[0].text = title
+    
+    # Zellinhalte werden unverändert ins XML übernommen, daher einmalig prüfen statt pro Zelle str()
+    assert all(isinstance(text, str) for row in data for text in row), "Tabellenzellen müssen Strings sein"
     
     rows = len(data)
     cols = len(data[0])
     
-    left = Inches(1.0)
-    top = Inches(2.0)
-    width = Inches(8.0)
-    height = Inches(0.8 * rows)
+    # Das Tabellen-XML übernimmt die Form der Daten direkt, sie muss daher rechteckig sein
+    if any(len(row) != cols for row in data):
+        raise ValueError("Alle Tabellenzeilen müssen gleich viele Zellen haben")
+    if col_widths and len(col_widths) != cols:
+        raise ValueError("Anzahl Spaltenbreiten (%d) passt nicht zur Tabelle (%d)" % (len(col_widths), cols))
     
-    table = slide.shapes.add_table(rows, cols, left, top, width, height).table
+    height = int(0.8 * rows * _EMU)
     
-    # Spaltenbreiten setzen
+    # Spaltenbreiten setzen (ohne Vorgabe gleichmäßig über die Gesamtbreite)
     if col_widths:
-        for i, width in enumerate(col_widths):
-            table.columns[i].width = Inches(width)
+        col_widths_emu = [int(width * _EMU) for width in col_widths]
+    else:
+        col_widths_emu = _split_evenly(_WIDTH, cols)
     
-    # Tabelle füllen
-    for i, row in enumerate(data):
-        for j, cell_text in enumerate(row):
-            cell = table.rows[i].cells[j]
-            cell.text = str(cell_text)
-            
-            # Header-Zeile formatieren
-            if i == 0:
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = RGBColor(68, 114, 196)
-                for paragraph in cell.text_frame.paragraphs:
-                    for run in paragraph.runs:
-                        run.font.bold = True
-                        run.font.color.rgb = RGBColor(255, 255, 255)
-                        run.font.size = Pt(12)
-            else:
-                for paragraph in cell.text_frame.paragraphs:
-                    for run in paragraph.runs:
-                        run.font.size = Pt(11)
+    # Tabelle als Ganzes erzeugen und mit einem einzigen Parse einfügen
+    shapes = slide.shapes
+    xml = _build_table_xml(
+        shapes._next_shape_id, data, col_widths_emu, _split_evenly(height, rows), _LEFT, _TOP
+    )
+    shapes._spTree.append(parse_xml(xml))
     
     return slide
 
-def main():
-    prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(7.5)
-    
+# Folieninhalte als unveränderliche Konstanten: (Ebene, Text)
+# Folie 2: Agenda
+AGENDA_BULLETS: Bullets = (
+    (0, "1. Einführung und Problemstellung"),
+    (0, "2. Datenanalyse und -vorbereitung (CRISP-DM)"),
+    (0, "3. Attributanalyse und Feature Engineering"),
+    (0, "4. Modellauswahl und Training"),
+    (0, "5. Modellbewertung und Optimierung"),
+    (0, "6. Vorhersage und Fazit"),
+)
+
+# Folie 3: Problemstellung
+PROBLEM_BULLETS: Bullets = (
+    (0, "Szenario: Betrugserkennung im Online-Handel"),
+    (1, "Herausforderung: Ware gegen Geld nicht direkt umsetzbar"),
+    (1, "Risiko: Bestellungen ohne Zahlungseingang"),
+    (0, "Data Mining Aufgabe:"),
+    (1, "Typ: Klassifikationsproblem (Überwachtes Lernen)"),
+    (1, "Zielattribut: TARGET_BETRUG (diskret: ja/nein)"),
+    (0, "Datensatz: 30.000 E-Commerce Bestellungen"),
+    (1, "Training: 24.000 Datensätze (80% - Holdout-Methode)"),
+    (1, "Test: 6.000 Datensätze (20%)"),
+    (1, "Klassifizierung: 20.000 neue Bestellungen"),
+)
+
+# Folie 4: CRISP-DM und Data Understanding
+DATA_UNDERSTANDING_BULLETS: Bullets = (
+    (0, "Explorative Datenanalyse der Trainingsdaten:"),
+    (1, "30.000 Bestellungen mit 43 Attributen"),
+    (1, "Zielattribut TARGET_BETRUG analysiert"),
+    (0, "Zentrale Erkenntnis: Stark unbalancierte Klassen"),
+    (1, "Nur 1.746 Betrugsfälle (5,82%)"),
+    (1, "28.254 legitime Bestellungen (94,18%)"),
+    (0, "Implikation für Data Mining:"),
+    (1, "❌ Accuracy allein als Gütemaß ungeeignet"),
+    (1, "✓ Precision & Recall sind entscheidend"),
+    (1, "Modell könnte \"immer nein\" vorhersagen (94% Accuracy!)"),
+    (1, "→ Betrugsfälle würden nicht erkannt werden"),
+)
+
+# Folie 5: Feature Engineering
+FEATURE_ENGINEERING_BULLETS: Bullets = (
+    (0, "Analyse der Artikelnummer-Attribute (ANUMMER_01 bis ANUMMER_10):"),
+    (1, "Repräsentieren bestellte Artikel (Artikelnummern)"),
+    (1, "Datentyp: Diskret (kategorisch)"),
+    (0, "Identifizierte Probleme:"),
+    (1, "❌ Limitation: Maximal 10 Artikel erfassbar"),
+    (1, "❌ Bei >10 Artikeln: Datenverlust"),
+    (1, "❌ ANUMMER_02 bis ANUMMER_10 größtenteils NULL"),
+    (1, "❌ Hohe Dimensionalität mit vielen Leereinträgen"),
+    (0, "Feature Engineering - Optimierungsansatz:"),
+    (1, "✓ Zusammenführung zu ANUMMER_LIST (aggregiert)"),
+    (1, "✓ Reduzierung der Dimensionalität (10→1 Attribut)"),
+    (1, "✓ Bessere Datenqualität für ML-Algorithmen"),
+)
+
+# Folie 6: Modellierung
+MODELING_BULLETS: Bullets = (
+    (0, "Implementierung: KNIME Analytics Platform"),
+    (0, "Trainingsmethode: Holdout-Methode"),
+    (1, "80% Trainingsdaten (24.000 Datensätze)"),
+    (1, "20% Testdaten (6.000 Datensätze)"),
+    (0, "Drei Klassifikationsverfahren (Überwachtes Lernen):"),
+    (1, "1. Decision Tree (Entscheidungsbaum, Gini Index)"),
+    (2, "Trennscharfe Entscheidungsregeln"),
+    (1, "2. Logistic Regression (Logistische Regression)"),
+    (2, "Lineare Trennung der Klassen"),
+    (1, "3. Naive Bayes Classifier"),
+    (2, "Probabilistischer Ansatz, bedingte Wahrscheinlichkeiten"),
+)
+
+# Folie 7: Konfusionsmatrix Erklärung
+EVALUATION_BULLETS: Bullets = (
+    (0, "Bewertung mit Konfusionsmatrix:"),
+    (1, "True Positive (TP): Betrug korrekt als Betrug erkannt"),
+    (1, "True Negative (TN): Kein Betrug korrekt als legitim erkannt"),
+    (1, "False Positive (FP): Legitim fälschlich als Betrug erkannt"),
+    (1, "False Negative (FN): Betrug fälschlich als legitim erkannt"),
+    (0, "Gütekriterien:"),
+    (1, "Accuracy = (TP+TN) / Gesamt"),
+    (2, "Gesamtgenauigkeit aller Vorhersagen"),
+    (1, "Precision = TP / (TP+FP)"),
+    (2, "Wie viele Betrugsvorhersagen waren korrekt?"),
+    (1, "Recall = TP / (TP+FN)"),
+    (2, "Wie viele Betrugsfälle wurden erkannt?"),
+)
+
+# Folie 9: Decision Tree Metriken
+DT_METRICS_BULLETS: Bullets = (
+    (0, "Berechnete Gütekriterien:"),
+    (1, "Accuracy: 91,78% = (5466+36) / 6000"),
+    (1, "Precision: 15,72% = 36 / (36+193)"),
+    (1, "Recall: 9,33% = 36 / (36+300)"),
+    (0, "Interpretation:"),
+    (1, "✓ Erkennt tatsächlich Betrugsfälle (36 TP)"),
+    (1, "✓ Besser als \"immer nein\" Baseline"),
+    (1, "⚠ Hohe False-Positive Rate (193 Fehlalarme)"),
+    (1, "⚠ Niedriger Recall (300 FN, 89% nicht erkannt)"),
+    (0, "Bewertung: Einziges Modell mit relevantem Recall"),
+)
+
+# Folie 10: Logistic Regression
+LOGREG_BULLETS: Bullets = (
+    (0, "Confusion Matrix:"),
+    (1, "TN: 5666, FP: 0, FN: 336, TP: 0"),
+    (1, "Alle Vorhersagen: \"nein\" (kein Betrug)"),
+    (0, "Berechnete Metriken:"),
+    (1, "Accuracy: 94,40% = 5666 / 6000"),
+    (1, "Precision: 0% (keine Betrugsvorhersagen)"),
+    (1, "Recall: 0% = 0 / 336 (alle Betrugsfälle übersehen)"),
+    (0, "❌ Fazit: Modell unbrauchbar für Betrugserkennung"),
+    (1, "Paradox: Hohe Accuracy durch Class Imbalance"),
+    (1, "Modell hat aus Unbalance gelernt, immer \"nein\" zu sagen"),
+    (1, "Kein einziger Betrugsfall erkannt (0 TP)"),
+)
+
+# Folie 11: Naive Bayes
+NAIVE_BAYES_BULLETS: Bullets = (
+    (0, "Confusion Matrix:"),
+    (1, "TN: 5663, FP: 3, FN: 333, TP: 3"),
+    (0, "Berechnete Metriken:"),
+    (1, "Accuracy: 94,44% = (5663+3) / 6000"),
+    (1, "Precision: 50,00% = 3 / (3+3)"),
+    (1, "Recall: 0,89% = 3 / (3+333)"),
+    (0, "Bewertung:"),
+    (1, "✓ Hohe Precision bei Betrugsvorhersagen (50%)"),
+    (1, "✓ Sehr wenig Fehlalarme (nur 3 FP)"),
+    (1, "❌ Extrem niedriger Recall (0,89%)"),
+    (1, "❌ Erkennt fast keine Betrugsfälle (nur 3 von 336)"),
+    (0, "Fazit: Zu konservativ, praktisch unbrauchbar"),
+)
+
+# Folie 13: Optimierung
+OPTIMIZATION_BULLETS: Bullets = (
+    (0, "Hauptproblem: Class Imbalance (5,82% Betrug)"),
+    (0, "Resampling-Techniken:"),
+    (1, "Undersampling: Reduzierung der Mehrheitsklasse"),
+    (2, "Zufällige Auswahl von legitimen Bestellungen"),
+    (1, "SMOTE (Synthetic Minority Over-sampling Technique)"),
+    (2, "Synthetische Generierung zusätzlicher Betrugsfälle"),
+    (0, "Algorithmus-Optimierung:"),
+    (1, "Hyperparameter-Tuning (Complexity_Penalty, Minimum_Support)"),
+    (1, "Cost-Sensitive Learning (höhere Kosten für FN)"),
+    (0, "Weitere Ansätze:"),
+    (1, "Ensemble-Methoden (Random Forest, XGBoost)"),
+    (1, "Feature Engineering (ANUMMER_LIST verwenden)"),
+)
+
+# Folie 14: Vorhersage und Deployment
+DEPLOYMENT_BULLETS: Bullets = (
+    (0, "Gewähltes Modell für Produktivbetrieb:"),
+    (1, "✓ Decision Tree (Entscheidungsbaum)"),
+    (0, "Begründung der Auswahl:"),
+    (1, "Einziges Modell mit relevantem Recall (9,33%)"),
+    (1, "Erkennt tatsächlich Betrugsfälle (36 TP)"),
+    (1, "Trade-off: Niedrigere Accuracy, aber Betrugserkennnung"),
+    (0, "Anwendung auf Klassifizierungsdaten:"),
+    (1, "20.000 neue Bestellungen klassifiziert"),
+    (1, "Datei: Klassifizierungsdaten-tree-predictions.csv"),
+    (0, "Kritische Einschätzung:"),
+    (1, "Performance noch verbesserungswürdig"),
+    (1, "Optimierungsmaßnahmen empfohlen (Resampling, etc.)"),
+)
+
+# Folie 15: Zusammenfassung
+SUMMARY_BULLETS: Bullets = (
+    (0, "Zentrale Erkenntnisse:"),
+    (1, "Class Imbalance größte Herausforderung bei Betrugserkennung"),
+    (1, "Accuracy irreführend bei unbalancierten Daten"),
+    (1, "Precision & Recall entscheidende Gütekriterien"),
+    (1, "CRISP-DM-Prozess systematisch durchgeführt"),
+    (0, "Durchgeführte Schritte:"),
+    (1, "✓ Data Understanding (Class Imbalance identifiziert)"),
+    (1, "✓ Data Preparation (ANUMMER Feature Engineering)"),
+    (1, "✓ Modeling (3 Klassifikationsverfahren trainiert)"),
+    (1, "✓ Evaluation (Konfusionsmatrix, Metriken)"),
+    (1, "✓ Deployment (Decision Tree für Vorhersage gewählt)"),
+    (0, "Vielen Dank für Ihre Aufmerksamkeit!"),
+)
+
+# Folie 8: Decision Tree Confusion Matrix
+DT_CONFUSION_TABLE: TableData = (
+    ("", "Predicted: nein", "Predicted: ja"),
+    ("Actual: nein", "5466 (TN)", "193 (FP)"),
+    ("Actual: ja", "300 (FN)", "36 (TP)"),
+)
+
+# Folie 12: Modellvergleich
+COMPARISON_TABLE: TableData = (
+    ("Modell", "Accuracy", "Precision", "Recall", "TP", "Bewertung"),
+    ("Decision Tree", "91,78%", "15,72%", "9,33%", "36", "⭐ GEWÄHLT"),
+    ("Logistic Regression", "94,40%", "0%", "0%", "0", "❌ Unbrauchbar"),
+    ("Naive Bayes", "94,44%", "50,00%", "0,89%", "3", "⚠ Zu konservativ"),
+)
+
+# Gesamter Folienablauf: (Art, Titel, Inhalt[, Spaltenbreiten])
+ALL_SLIDE_DATA: Tuple[SlideSpec, ...] = (
     # Folie 1: Titel
-    create_title_slide(
-        prs,
-        "Data Mining: Betrugserkennung",
-        "Klassifikation von E-Commerce Bestellungen"
-    )
-    
+    ("title", "Data Mining: Betrugserkennung", "Klassifikation von E-Commerce Bestellungen"),
     # Folie 2: Agenda
-    create_content_slide(
-        prs,
-        "Agenda",
-        [
-            (0, "1. Einführung und Problemstellung"),
-            (0, "2. Datenanalyse und -vorbereitung (CRISP-DM)"),
-            (0, "3. Attributanalyse und Feature Engineering"),
-            (0, "4. Modellauswahl und Training"),
-            (0, "5. Modellbewertung und Optimierung"),
-            (0, "6. Vorhersage und Fazit")
-        ]
-    )
-    
+    ("content", "Agenda", AGENDA_BULLETS),
     # Folie 3: Problemstellung
-    create_content_slide(
-        prs,
-        "1. Einführung und Problemstellung",
-        [
-            (0, "Szenario: Betrugserkennung im Online-Handel"),
-            (1, "Herausforderung: Ware gegen Geld nicht direkt umsetzbar"),
-            (1, "Risiko: Bestellungen ohne Zahlungseingang"),
-            (0, "Data Mining Aufgabe:"),
-            (1, "Typ: Klassifikationsproblem (Überwachtes Lernen)"),
-            (1, "Zielattribut: TARGET_BETRUG (diskret: ja/nein)"),
-            (0, "Datensatz: 30.000 E-Commerce Bestellungen"),
-            (1, "Training: 24.000 Datensätze (80% - Holdout-Methode)"),
-            (1, "Test: 6.000 Datensätze (20%)"),
-            (1, "Klassifizierung: 20.000 neue Bestellungen")
-        ]
-    )
-    
+    ("content", "1. Einführung und Problemstellung", PROBLEM_BULLETS),
     # Folie 4: CRISP-DM und Data Understanding
-    create_content_slide(
-        prs,
-        "2. Datenanalyse (CRISP-DM: Data Understanding)",
-        [
-            (0, "Explorative Datenanalyse der Trainingsdaten:"),
-            (1, "30.000 Bestellungen mit 43 Attributen"),
-            (1, "Zielattribut TARGET_BETRUG analysiert"),
-            (0, "Zentrale Erkenntnis: Stark unbalancierte Klassen"),
-            (1, "Nur 1.746 Betrugsfälle (5,82%)"),
-            (1, "28.254 legitime Bestellungen (94,18%)"),
-            (0, "Implikation für Data Mining:"),
-            (1, "❌ Accuracy allein als Gütemaß ungeeignet"),
-            (1, "✓ Precision & Recall sind entscheidend"),
-            (1, "Modell könnte \"immer nein\" vorhersagen (94% Accuracy!)"),
-            (1, "→ Betrugsfälle würden nicht erkannt werden")
-        ]
-    )
-    
+    ("content", "2. Datenanalyse (CRISP-DM: Data Understanding)", DATA_UNDERSTANDING_BULLETS),
     # Folie 5: Feature Engineering
-    create_content_slide(
-        prs,
-        "3. Attributanalyse & Feature Engineering (Data Preparation)",
-        [
-            (0, "Analyse der Artikelnummer-Attribute (ANUMMER_01 bis ANUMMER_10):"),
-            (1, "Repräsentieren bestellte Artikel (Artikelnummern)"),
-            (1, "Datentyp: Diskret (kategorisch)"),
-            (0, "Identifizierte Probleme:"),
-            (1, "❌ Limitation: Maximal 10 Artikel erfassbar"),
-            (1, "❌ Bei >10 Artikeln: Datenverlust"),
-            (1, "❌ ANUMMER_02 bis ANUMMER_10 größtenteils NULL"),
-            (1, "❌ Hohe Dimensionalität mit vielen Leereinträgen"),
-            (0, "Feature Engineering - Optimierungsansatz:"),
-            (1, "✓ Zusammenführung zu ANUMMER_LIST (aggregiert)"),
-            (1, "✓ Reduzierung der Dimensionalität (10→1 Attribut)"),
-            (1, "✓ Bessere Datenqualität für ML-Algorithmen")
-        ]
-    )
-    
+    ("content", "3. Attributanalyse & Feature Engineering (Data Preparation)", FEATURE_ENGINEERING_BULLETS),
     # Folie 6: Modellierung
-    create_content_slide(
-        prs,
-        "4. Modellauswahl und Training (CRISP-DM: Modeling)",
-        [
-            (0, "Implementierung: KNIME Analytics Platform"),
-            (0, "Trainingsmethode: Holdout-Methode"),
-            (1, "80% Trainingsdaten (24.000 Datensätze)"),
-            (1, "20% Testdaten (6.000 Datensätze)"),
-            (0, "Drei Klassifikationsverfahren (Überwachtes Lernen):"),
-            (1, "1. Decision Tree (Entscheidungsbaum, Gini Index)"),
-            (2, "Trennscharfe Entscheidungsregeln"),
-            (1, "2. Logistic Regression (Logistische Regression)"),
-            (2, "Lineare Trennung der Klassen"),
-            (1, "3. Naive Bayes Classifier"),
-            (2, "Probabilistischer Ansatz, bedingte Wahrscheinlichkeiten")
-        ]
-    )
-    
+    ("content", "4. Modellauswahl und Training (CRISP-DM: Modeling)", MODELING_BULLETS),
     # Folie 7: Konfusionsmatrix Erklärung
-    create_content_slide(
-        prs,
-        "5. Modellbewertung (CRISP-DM: Evaluation)",
-        [
-            (0, "Bewertung mit Konfusionsmatrix:"),
-            (1, "True Positive (TP): Betrug korrekt als Betrug erkannt"),
-            (1, "True Negative (TN): Kein Betrug korrekt als legitim erkannt"),
-            (1, "False Positive (FP): Legitim fälschlich als Betrug erkannt"),
-            (1, "False Negative (FN): Betrug fälschlich als legitim erkannt"),
-            (0, "Gütekriterien:"),
-            (1, "Accuracy = (TP+TN) / Gesamt"),
-            (2, "Gesamtgenauigkeit aller Vorhersagen"),
-            (1, "Precision = TP / (TP+FP)"),
-            (2, "Wie viele Betrugsvorhersagen waren korrekt?"),
-            (1, "Recall = TP / (TP+FN)"),
-            (2, "Wie viele Betrugsfälle wurden erkannt?")
-        ]
-    )
-    
+    ("content", "5. Modellbewertung (CRISP-DM: Evaluation)", EVALUATION_BULLETS),
     # Folie 8: Decision Tree Confusion Matrix
-    table_data = [
-        ["", "Predicted: nein", "Predicted: ja"],
-        ["Actual: nein", "5466 (TN)", "193 (FP)"],
-        ["Actual: ja", "300 (FN)", "36 (TP)"]
-    ]
-    
-    create_table_slide(
-        prs,
-        "5a. Decision Tree - Confusion Matrix",
-        table_data,
-        col_widths=[3.0, 2.5, 2.5]
-    )
-    
+    ("table", "5a. Decision Tree - Confusion Matrix", DT_CONFUSION_TABLE, (3.0, 2.5, 2.5)),
     # Folie 9: Decision Tree Metriken
-    create_content_slide(
-        prs,
-        "5a. Decision Tree - Metriken",
-        [
-            (0, "Berechnete Gütekriterien:"),
-            (1, "Accuracy: 91,78% = (5466+36) / 6000"),
-            (1, "Precision: 15,72% = 36 / (36+193)"),
-            (1, "Recall: 9,33% = 36 / (36+300)"),
-            (0, "Interpretation:"),
-            (1, "✓ Erkennt tatsächlich Betrugsfälle (36 TP)"),
-            (1, "✓ Besser als \"immer nein\" Baseline"),
-            (1, "⚠ Hohe False-Positive Rate (193 Fehlalarme)"),
-            (1, "⚠ Niedriger Recall (300 FN, 89% nicht erkannt)"),
-            (0, "Bewertung: Einziges Modell mit relevantem Recall")
-        ]
-    )
-    
+    ("content", "5a. Decision Tree - Metriken", DT_METRICS_BULLETS),
     # Folie 10: Logistic Regression
-    create_content_slide(
-        prs,
-        "5b. Logistic Regression - Ergebnisse",
-        [
-            (0, "Confusion Matrix:"),
-            (1, "TN: 5666, FP: 0, FN: 336, TP: 0"),
-            (1, "Alle Vorhersagen: \"nein\" (kein Betrug)"),
-            (0, "Berechnete Metriken:"),
-            (1, "Accuracy: 94,40% = 5666 / 6000"),
-            (1, "Precision: 0% (keine Betrugsvorhersagen)"),
-            (1, "Recall: 0% = 0 / 336 (alle Betrugsfälle übersehen)"),
-            (0, "❌ Fazit: Modell unbrauchbar für Betrugserkennung"),
-            (1, "Paradox: Hohe Accuracy durch Class Imbalance"),
-            (1, "Modell hat aus Unbalance gelernt, immer \"nein\" zu sagen"),
-            (1, "Kein einziger Betrugsfall erkannt (0 TP)")
-        ]
-    )
-    
+    ("content", "5b. Logistic Regression - Ergebnisse", LOGREG_BULLETS),
     # Folie 11: Naive Bayes
-    create_content_slide(
-        prs,
-        "5c. Naive Bayes - Ergebnisse",
-        [
-            (0, "Confusion Matrix:"),
-            (1, "TN: 5663, FP: 3, FN: 333, TP: 3"),
-            (0, "Berechnete Metriken:"),
-            (1, "Accuracy: 94,44% = (5663+3) / 6000"),
-            (1, "Precision: 50,00% = 3 / (3+3)"),
-            (1, "Recall: 0,89% = 3 / (3+333)"),
-            (0, "Bewertung:"),
-            (1, "✓ Hohe Precision bei Betrugsvorhersagen (50%)"),
-            (1, "✓ Sehr wenig Fehlalarme (nur 3 FP)"),
-            (1, "❌ Extrem niedriger Recall (0,89%)"),
-            (1, "❌ Erkennt fast keine Betrugsfälle (nur 3 von 336)"),
-            (0, "Fazit: Zu konservativ, praktisch unbrauchbar")
-        ]
-    )
-    
+    ("content", "5c. Naive Bayes - Ergebnisse", NAIVE_BAYES_BULLETS),
     # Folie 12: Modellvergleich
-    comparison_data = [
-        ["Modell", "Accuracy", "Precision", "Recall", "TP", "Bewertung"],
-        ["Decision Tree", "91,78%", "15,72%", "9,33%", "36", "⭐ GEWÄHLT"],
-        ["Logistic Regression", "94,40%", "0%", "0%", "0", "❌ Unbrauchbar"],
-        ["Naive Bayes", "94,44%", "50,00%", "0,89%", "3", "⚠ Zu konservativ"]
-    ]
+    ("table", "5d. Vergleichende Modellbewertung", COMPARISON_TABLE, (2.3, 1.3, 1.3, 1.3, 0.8, 2.0)),
+    # Folie 13: Optimierung
+    ("content", "5e. Maßnahmen zur Ergebnisverbesserung", OPTIMIZATION_BULLETS),
+    # Folie 14: Vorhersage und Deployment
+    ("content", "6. Vorhersage (CRISP-DM: Deployment)", DEPLOYMENT_BULLETS),
+    # Folie 15: Zusammenfassung
+    ("content", "Zusammenfassung und Ausblick", SUMMARY_BULLETS),
+)
+
+# Folienart -> (Erstellungsfunktion, Index des Folienlayouts)
+SLIDE_BUILDERS: Dict[str, Tuple[Callable[..., Slide], int]] = {
+    "title": (create_title_slide, 0),
+    "content": (create_content_slide, 1),
+    "table": (create_table_slide, 5),
+}
+
+OUTPUT_FILE = "Data_Mining_Betrugserkennung_Praesentation.pptx"
+
+@contextlib.contextmanager
+def _zip_stored() -> Iterator[None]:
+    """Lässt python-pptx innerhalb des Blocks unkomprimiert (ZIP_STORED) statt mit DEFLATE schreiben"""
+    # python-pptx öffnet das Paket mit zipfile.ZIP_DEFLATED; ersetzt wird nur sein Verweis auf das
+    # zipfile-Modul, andere zipfile-Nutzer bleiben unberührt. Ändert python-pptx das, wird
+    # lediglich wieder komprimiert gespeichert
+    original = serialized.zipfile
+    stored = types.SimpleNamespace(**vars(zipfile))
+    stored.ZIP_DEFLATED = zipfile.ZIP_STORED
+    setattr(serialized, "zipfile", stored)
+    try:
+        yield
+    finally:
+        setattr(serialized, "zipfile", original)
+
+# Die Präsentation wird unkomprimiert (ZIP_STORED) gespeichert: das Speichern ist deutlich
+# schneller, die Datei dafür rund dreimal so groß (ca. 45 KB mit DEFLATE -> ca. 143 KB)
+def save_presentation(prs: PresentationT, path: str) -> None:
+    """Speichert die Präsentation ohne Kompression (schneller, dafür größere Datei)"""
+    with _zip_stored():
+        prs.save(path)
+
+def content_hash() -> str:
+    """Berechnet den SHA256-Hash über alle Folieninhalte und den erzeugenden Code"""
+    # Der eigene Quelltext fließt mit ein, damit Änderungen an Formatierung, Geometrie oder
+    # Speicherformat ebenfalls eine Neuerzeugung auslösen
+    with open(__file__, "rb") as f:
+        source = f.read()
+    h = hashlib.sha256(source)
+    h.update(repr(ALL_SLIDE_DATA).encode("utf-8"))
+    return h.hexdigest()
+
+def read_content_hash(path: str) -> Optional[str]:
+    """Liest den in einer vorhandenen Präsentation hinterlegten Inhalts-Hash (None, falls keiner)"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with zipfile.ZipFile(path) as zf:
+            core = parse_xml(zf.read("docProps/core.xml"))
+    except (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError, OSError):
+        return None
+    return core.findtext(qn("cp:keywords"))
+
+def build_slide(
+    prs: PresentationT, slide_layouts: Dict[str, SlideLayout], spec: SlideSpec
+) -> Slide:
+    """Erstellt eine Folie aus einem Eintrag von ALL_SLIDE_DATA"""
+    kind, title, *content = spec
+    create_slide, _ = SLIDE_BUILDERS[kind]
+    return create_slide(prs, slide_layouts[kind], title, *content)
+
+def main(force: bool = False) -> None:
+    output_file = OUTPUT_FILE
     
-    create_table_slide(
-        prs,
-        "5d. Vergleichende Modellbewertung",
-        comparison_data,
-        col_widths=[2.3, 1.3, 1.3, 1.3, 0.8, 2.0]
-    )
+    # Inhalte sind statisch: vorhandene Datei mit gleichem Hash muss nicht neu erzeugt werden
+    h = content_hash()
+    if not force and read_content_hash(output_file) == h:
+        print(f"✓ Präsentation ist aktuell: {output_file} (Neuerzeugung mit --force)")
+        return
     
-    # Folie 13: Optimierung
-    create_content_slide(
-        prs,
-        "5e. Maßnahmen zur Ergebnisverbesserung",
-        [
-            (0, "Hauptproblem: Class Imbalance (5,82% Betrug)"),
-            (0, "Resampling-Techniken:"),
-            (1, "Undersampling: Reduzierung der Mehrheitsklasse"),
-            (2, "Zufällige Auswahl von legitimen Bestellungen"),
-            (1, "SMOTE (Synthetic Minority Over-sampling Technique)"),
-            (2, "Synthetische Generierung zusätzlicher Betrugsfälle"),
-            (0, "Algorithmus-Optimierung:"),
-            (1, "Hyperparameter-Tuning (Complexity_Penalty, Minimum_Support)"),
-            (1, "Cost-Sensitive Learning (höhere Kosten für FN)"),
-            (0, "Weitere Ansätze:"),
-            (1, "Ensemble-Methoden (Random Forest, XGBoost)"),
-            (1, "Feature Engineering (ANUMMER_LIST verwenden)")
-        ]
-    )
+    prs = Presentation()
+    prs.slide_width = _SLIDE_WIDTH
+    prs.slide_height = _SLIDE_HEIGHT
     
-    # Folie 14: Vorhersage und Deployment
-    create_content_slide(
-        prs,
-        "6. Vorhersage (CRISP-DM: Deployment)",
-        [
-            (0, "Gewähltes Modell für Produktivbetrieb:"),
-            (1, "✓ Decision Tree (Entscheidungsbaum)"),
-            (0, "Begründung der Auswahl:"),
-            (1, "Einziges Modell mit relevantem Recall (9,33%)"),
-            (1, "Erkennt tatsächlich Betrugsfälle (36 TP)"),
-            (1, "Trade-off: Niedrigere Accuracy, aber Betrugserkennnung"),
-            (0, "Anwendung auf Klassifizierungsdaten:"),
-            (1, "20.000 neue Bestellungen klassifiziert"),
-            (1, "Datei: Klassifizierungsdaten-tree-predictions.csv"),
-            (0, "Kritische Einschätzung:"),
-            (1, "Performance noch verbesserungswürdig"),
-            (1, "Optimierungsmaßnahmen empfohlen (Resampling, etc.)")
-        ]
-    )
+    # Folienlayouts einmalig auflösen
+    layouts = prs.slide_layouts
+    slide_layouts = {kind: layouts[idx] for kind, (_, idx) in SLIDE_BUILDERS.items()}
     
-    # Folie 15: Zusammenfassung
-    create_content_slide(
-        prs,
-        "Zusammenfassung und Ausblick",
-        [
-            (0, "Zentrale Erkenntnisse:"),
-            (1, "Class Imbalance größte Herausforderung bei Betrugserkennung"),
-            (1, "Accuracy irreführend bei unbalancierten Daten"),
-            (1, "Precision & Recall entscheidende Gütekriterien"),
-            (1, "CRISP-DM-Prozess systematisch durchgeführt"),
-            (0, "Durchgeführte Schritte:"),
-            (1, "✓ Data Understanding (Class Imbalance identifiziert)"),
-            (1, "✓ Data Preparation (ANUMMER Feature Engineering)"),
-            (1, "✓ Modeling (3 Klassifikationsverfahren trainiert)"),
-            (1, "✓ Evaluation (Konfusionsmatrix, Metriken)"),
-            (1, "✓ Deployment (Decision Tree für Vorhersage gewählt)"),
-            (0, "Vielen Dank für Ihre Aufmerksamkeit!")
-        ]
-    )
+    for spec in ALL_SLIDE_DATA:
+        build_slide(prs, slide_layouts, spec)
     
-    # Präsentation speichern
-    output_file = "Data_Mining_Betrugserkennung_Praesentation.pptx"
-    prs.save(output_file)
-    print(f"✓ Präsentation erfolgreich erstellt: {output_file}")
-    print(f"✓ Anzahl Folien: {len(prs.slides)}")
-    print(f"\nStruktur nach CRISP-DM:")
-    print("  1. Einführung und Problemstellung")
-    print("  2. Data Understanding (Class Imbalance)")
-    print("  3. Data Preparation (Feature Engineering)")
-    print("  4. Modeling (3 Klassifikationsverfahren)")
-    print("  5. Evaluation (Konfusionsmatrix, Metriken)")
-    print("  6. Deployment (Vorhersage)")
+    # Präsentation im Hintergrund speichern (Hash für den nächsten Lauf hinterlegen),
+    # die Zusammenfassung wird währenddessen ausgegeben
+    prs.core_properties.keywords = h
+    slide_count = len(prs.slides)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        saved = executor.submit(save_presentation, prs, output_file)
+        print(f"✓ Anzahl Folien: {slide_count}")
+        print(f"\nStruktur nach CRISP-DM:")
+        print("  1. Einführung und Problemstellung")
+        print("  2. Data Understanding (Class Imbalance)")
+        print("  3. Data Preparation (Feature Engineering)")
+        print("  4. Modeling (3 Klassifikationsverfahren)")
+        print("  5. Evaluation (Konfusionsmatrix, Metriken)")
+        print("  6. Deployment (Vorhersage)")
+        saved.result()
+    print(f"\n✓ Präsentation erfolgreich erstellt: {output_file}")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Erstellt die Präsentation zur Betrugserkennung")
+    parser.add_argument(
+        "--force", action="store_true", help="Präsentation auch bei unverändertem Inhalt neu erzeugen"
+    )
+    main(force=parser.parse_args().force)